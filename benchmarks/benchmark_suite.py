@@ -5,14 +5,16 @@ Generates synthetic alarm patterns and tests detection robustness
 against increasing noise levels.
 """
 
+import functools
 import logging
 import os
 import sys
 import tempfile
+import wave
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
-from scipy.io import wavfile
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -23,73 +25,141 @@ from acoustic_engine.tester.runner import TestRunner
 # Configure logging to only show critical errors during benchmark to keep output clean
 logging.basicConfig(level=logging.ERROR)
 
+# Shared PCG64 generator; fixed seed keeps benchmark runs reproducible
+_RNG = np.random.default_rng(0)
+
+# Sine lookup table for tone synthesis. 16384 entries bound the phase
+# rounding error at pi/16384 (about -74 dB), well under the int16
+# quantization floor the audio ends up at.
+_LUT_N = 16384
+_SIN_LUT = np.sin(2 * np.pi * np.arange(_LUT_N) / _LUT_N).astype(np.float32)
+
 
 class AudioGenerator:
     """Generates synthetic audio files."""
 
     def __init__(self, sample_rate: int = 44100):
         self.sample_rate = sample_rate
+        # Read-only zero buffers keyed by length; silence is content-free,
+        # so callers can share one allocation per size
+        self._silence_cache: dict = {}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _tone_buffer(sample_rate: int, frequency: float, n_samples: int) -> np.ndarray:
+        """Unit-amplitude sine buffer, cached per (rate, frequency, length)."""
+        # Table lookup instead of a transcendental per sample; the phase is
+        # accumulated in float64 so rounding can't drift over long buffers
+        step = frequency * _LUT_N / sample_rate
+        idx = np.arange(n_samples) * step
+        np.rint(idx, out=idx)
+        tone = _SIN_LUT[idx.astype(np.intp) % _LUT_N]
+        tone.flags.writeable = False
+        return tone
 
     def generate_tone(
         self, frequency: float, duration: float, amplitude: float = 0.5
     ) -> np.ndarray:
-        t = np.linspace(0, duration, int(self.sample_rate * duration), False)
-        # Generate sine wave
-        tone = np.sin(2 * np.pi * frequency * t) * amplitude
-        return tone
+        # Reuse the cached sine buffer; scenarios synthesize the same
+        # (frequency, duration) tone many times across noise levels.
+        tone = self._tone_buffer(self.sample_rate, frequency, int(self.sample_rate * duration))
+        return tone * amplitude
 
     def generate_silence(self, duration: float) -> np.ndarray:
-        return np.zeros(int(self.sample_rate * duration))
+        n = int(self.sample_rate * duration)
+        buf = self._silence_cache.get(n)
+        if buf is None:
+            buf = np.zeros(n, dtype=np.float32)
+            buf.flags.writeable = False
+            self._silence_cache[n] = buf
+        return buf
 
     def generate_noise(self, duration: float, amplitude: float = 0.5) -> np.ndarray:
-        # white noise
-        return np.random.uniform(-amplitude, amplitude, int(self.sample_rate * duration))
+        # white noise: one float32 draw rescaled in place to [-amplitude, amplitude)
+        noise = _RNG.random(int(self.sample_rate * duration), dtype=np.float32)
+        noise *= 2 * amplitude
+        noise -= amplitude
+        return noise
 
     def mix_noise(self, audio: np.ndarray, noise_level: float) -> np.ndarray:
         if noise_level <= 0:
             return audio
 
-        noise = self.generate_noise(len(audio) / self.sample_rate, amplitude=noise_level)
-        return audio + noise
-
-    def create_wav_file(self, filename: str, audio: np.ndarray):
-        # Convert to 16-bit PCM
-        max_val = np.max(np.abs(audio))
-        if max_val > 0:
-            normalized = audio / max_val * 0.9  # Avoid clipping
+        # Sized by sample count, not duration: the duration round-trip can
+        # come out one sample short for lengths that aren't exactly
+        # representable as seconds
+        noise = _RNG.random(len(audio), dtype=np.float32)
+        noise *= 2 * noise_level
+        noise -= noise_level
+        noise += audio
+        return noise
+
+    def create_wav_file(
+        self,
+        filename: str,
+        audio: np.ndarray,
+        already_normalized: bool = False,
+        peak: Optional[float] = None,
+    ):
+        # Convert to 16-bit PCM in one pass: fold normalization and the 32767
+        # quantization into a single scale written straight into the int16
+        # output buffer
+        if already_normalized:
+            # Caller guarantees |audio| <= 1.0, so skip the peak scan
+            scale = 0.9 * 32767
         else:
-            normalized = audio
-
-        int_audio = (normalized * 32767).astype(np.int16)
-        wavfile.write(filename, self.sample_rate, int_audio)
+            if peak is None:
+                # max/-min of the raw data avoids the abs(audio) temporary
+                peak = max(audio.max(), -audio.min())
+            scale = (0.9 * 32767 / peak) if peak > 0 else 32767.0
+
+        int_audio = np.empty(audio.shape, dtype=np.int16)
+        np.multiply(audio, scale, out=int_audio, casting="unsafe")
+        # Stdlib wave writes the RIFF header and raw frames directly,
+        # skipping scipy's dtype dispatch
+        with wave.open(filename, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(self.sample_rate)
+            wf.writeframesraw(int_audio.tobytes())
 
 
 def generate_t3_pattern(generator: AudioGenerator, frequency: float = 3000) -> np.ndarray:
     """Generates a T3 pattern (3 beeps)."""
     # T3: 0.5s ON, 0.5s OFF, 0.5s ON, 0.5s OFF, 0.5s ON, 1.5s OFF
     tone = generator.generate_tone(frequency, 0.5)
-    short_silence = generator.generate_silence(0.5)
-    long_silence = generator.generate_silence(1.5)
+    n_tone = len(tone)
+    n_short = int(generator.sample_rate * 0.5)
+    n_long = int(generator.sample_rate * 1.5)
 
-    pattern = np.concatenate([tone, short_silence, tone, short_silence, tone, long_silence])
+    # Fill one preallocated buffer instead of concatenating six arrays
+    pattern = np.zeros(3 * n_tone + 2 * n_short + n_long, dtype=tone.dtype)
+    offset = 0
+    for _ in range(3):
+        pattern[offset : offset + n_tone] = tone
+        offset += n_tone + n_short
 
     # Repeat pattern 3 times
-    return np.concatenate([pattern, pattern, pattern])
+    return np.tile(pattern, 3)
 
 
 def generate_fast_t4_pattern(generator: AudioGenerator, frequency: float = 3000) -> np.ndarray:
     """Generates a fast T4 pattern (4 short beeps)."""
     # Fast T4: 0.1s ON, 0.1s OFF (x4) then 2.0s OFF
     tone = generator.generate_tone(frequency, 0.05)  # Very fast 50ms beep
-    silence = generator.generate_silence(0.05)  # Very fast 50ms gap
-    long_silence = generator.generate_silence(2.0)
+    n_tone = len(tone)
+    n_gap = int(generator.sample_rate * 0.05)  # Very fast 50ms gap
+    n_long = int(generator.sample_rate * 2.0)
 
-    unit = np.concatenate([tone, silence])
-    # 4 beeps
-    pattern = np.concatenate([unit, unit, unit, unit, long_silence])
+    # 4 beeps, filled into one preallocated buffer
+    pattern = np.zeros(4 * (n_tone + n_gap) + n_long, dtype=tone.dtype)
+    offset = 0
+    for _ in range(4):
+        pattern[offset : offset + n_tone] = tone
+        offset += n_tone + n_gap
 
     # Repeat pattern 3 times
-    return np.concatenate([pattern, pattern, pattern])
+    return np.tile(pattern, 3)
 
 
 def create_t3_profile(filename: str):
@@ -220,9 +290,12 @@ def run_benchmark():
         # Generate Audio
         raw_audio = audio_func(gen)
 
+        # One WAV path per scenario, overwritten per noise level; the final
+        # rmtree cleans it up, so no per-iteration unlink is needed
+        wav_path = os.path.join(temp_dir, "test.wav")
+
         for noise in noise_levels:
             # Create Noisy Audio File
-            wav_path = os.path.join(temp_dir, f"test_{noise}.wav")
             mixed_audio = gen.mix_noise(raw_audio, noise)
             gen.create_wav_file(wav_path, mixed_audio)
 
@@ -257,9 +330,6 @@ def run_benchmark():
                 f"  Noise Level {noise * 100:3.0f}% ({snr_str}) | {status} | Matches: {len(runner.results.detections)}"
             )
 
-            # Cleanup wav
-            os.remove(wav_path)
-
     # Cleanup
     import shutil
 
@@ -13,6 +13,28 @@ import tempfile
 from pathlib import Path
 
 import numpy as np
+from scipy.signal import chirp as scipy_chirp
+from scipy.signal import fftconvolve
+
+try:  # Optional: JIT-compiles the recursive reverb fallback
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _reverb_inplace(output: np.ndarray, delay_samples: int, decay: float):
+    """Reference recursion y[n] += decay * y[n - D], kept as a fallback.
+
+    Compiled with Numba when available; the FFT path in apply_reverb is
+    preferred, this exists for spot-checking it and for environments where
+    the convolution's IR memory is a concern.
+    """
+    for i in range(delay_samples, output.shape[0]):
+        output[i] += output[i - delay_samples] * decay
+
+
+if njit is not None:
+    _reverb_inplace = njit(cache=True, fastmath=True)(_reverb_inplace)
 
 # Add current dir and src to path
 current_dir = Path(__file__).parent
@@ -28,19 +50,39 @@ from acoustic_engine.tester.runner import TestRunner
 class AdvancedAudioGenerator(AudioGenerator):
     """Generates audio with physical distortions like Reverb."""
 
+    def __init__(self, sample_rate: int = 44100):
+        super().__init__(sample_rate)
+        self._reverb_irs = {}
+
+    def _comb_impulse_response(self, decay: float, delay_samples: int) -> np.ndarray:
+        """Impulse response of the comb filter y[n] = x[n] + decay * y[n - D].
+
+        Taps sit at multiples of the delay with geometrically decaying gains;
+        the tail is truncated once taps fall below -80 dB.
+        """
+        key = (decay, delay_samples)
+        ir = self._reverb_irs.get(key)
+        if ir is None:
+            n_taps = int(np.ceil(np.log(1e-4) / np.log(decay)))
+            ir = np.zeros(n_taps * delay_samples + 1, dtype=np.float32)
+            ir[np.arange(n_taps) * delay_samples] = decay ** np.arange(n_taps)
+            self._reverb_irs[key] = ir
+        return ir
+
     def apply_reverb(self, audio: np.ndarray, decay: float = 0.3, delay_ms: int = 50) -> np.ndarray:
         """Simulates simple recursive echo/reverb."""
         delay_samples = int(self.sample_rate * (delay_ms / 1000.0))
-        output = audio.copy()
 
-        # Simple feedback loop reverb
-        for i in range(delay_samples, len(output)):
-            output[i] += output[i - delay_samples] * decay
+        # The feedback comb filter has a sparse, geometrically decaying impulse
+        # response, so FFT convolution (O(N log N)) beats running the recursion
+        # sample by sample even in C.
+        ir = self._comb_impulse_response(decay, delay_samples)
+        output = fftconvolve(audio.astype(np.float32), ir, mode="full")[: len(audio)]
 
         # Normalize to prevent clipping
         max_val = np.max(np.abs(output))
         if max_val > 1.0:
-            output /= max_val
+            np.divide(output, max_val, out=output)
 
         return output
 
@@ -53,9 +95,8 @@ class AdvancedAudioGenerator(AudioGenerator):
         # For simplicity, we'll just use a chirp for each beep
         def chirp(f0, f1, t_dur):
             t = np.linspace(0, t_dur, int(self.sample_rate * t_dur), False)
-            # Linear frequency sweep
-            phase = 2 * np.pi * (f0 * t + (f1 - f0) * t**2 / (2 * t_dur))
-            return np.sin(phase) * 0.5
+            # Linear frequency sweep in a single compiled kernel
+            return scipy_chirp(t, f0, t_dur, f1, method="linear", phi=-90) * 0.5
 
         beep1 = chirp(start_freq, start_freq + (end_freq - start_freq) * 0.3, 0.5)
         beep2 = chirp(
@@ -65,36 +106,49 @@ class AdvancedAudioGenerator(AudioGenerator):
         )
         beep3 = chirp(start_freq + (end_freq - start_freq) * 0.7, end_freq, 0.5)
 
-        silence = self.generate_silence(0.5)
-        long_silence = self.generate_silence(1.5)
+        n_beep = len(beep1)
+        n_silence = int(self.sample_rate * 0.5)
+        n_long = int(self.sample_rate * 1.5)
 
-        pattern = np.concatenate([beep1, silence, beep2, silence, beep3, long_silence])
-        return np.concatenate([pattern, pattern, pattern])
+        pattern = np.zeros(3 * n_beep + 2 * n_silence + n_long, dtype=beep1.dtype)
+        offset = 0
+        for beep in (beep1, beep2, beep3):
+            pattern[offset : offset + n_beep] = beep
+            offset += n_beep + n_silence
+        return np.tile(pattern, 3)
 
     def generate_collision(
         self, target_freq: float = 3000, distractor_freq: float = 2000
     ) -> np.ndarray:
         """Generates two overlapping alarm patterns."""
+        sr = self.sample_rate
+
         # Target: T3 at 3000Hz
         target = self.generate_tone(target_freq, 0.5)
-        sil_target = self.generate_silence(0.5)
-        long_sil_target = self.generate_silence(1.5)
-        target_pat = np.concatenate(
-            [target, sil_target, target, sil_target, target, long_sil_target]
-        )
-        target_audio = np.concatenate([target_pat, target_pat])
+        n_target = len(target)
+        n_sil = int(sr * 0.5)
+        n_long_sil = int(sr * 1.5)
+        target_pat = np.zeros(3 * n_target + 2 * n_sil + n_long_sil, dtype=target.dtype)
+        offset = 0
+        for _ in range(3):
+            target_pat[offset : offset + n_target] = target
+            offset += n_target + n_sil
+        target_audio = np.tile(target_pat, 2)
 
         # Distractor: Fast T4 at 2000Hz
         dist = self.generate_tone(distractor_freq, 0.1)
-        sil_dist = self.generate_silence(0.1)
-        long_sil_dist = self.generate_silence(2.0)
-        dist_pat = np.concatenate(
-            [dist, sil_dist, dist, sil_dist, dist, sil_dist, dist, long_sil_dist]
-        )
-        # Repeat 4 times to ensure audio is long enough (10s+)
-        dist_audio = np.concatenate(
-            [self.generate_silence(0.3), dist_pat, dist_pat, dist_pat, dist_pat]
-        )
+        n_dist = len(dist)
+        n_sil_dist = int(sr * 0.1)
+        n_long_dist = int(sr * 2.0)
+        dist_pat = np.zeros(4 * n_dist + 3 * n_sil_dist + n_long_dist, dtype=dist.dtype)
+        offset = 0
+        for _ in range(4):
+            dist_pat[offset : offset + n_dist] = dist
+            offset += n_dist + n_sil_dist
+        # Repeat 4 times (with a short lead-in) to ensure audio is long enough (10s+)
+        n_lead = int(sr * 0.3)
+        dist_audio = np.zeros(n_lead + 4 * len(dist_pat), dtype=dist.dtype)
+        dist_audio[n_lead:] = np.tile(dist_pat, 4)
 
         # Mix them (truncate to shortest - target is 8s, dist is 10s+)
         min_len = min(len(target_audio), len(dist_audio))
@@ -166,7 +220,8 @@ def run_edge_benchmarks():
     for decay in [0.3, 0.5, 0.7, 0.85]:
         wav_path = os.path.join(temp_dir, f"reverb_{decay}.wav")
         distorted = gen.apply_reverb(t3_audio, decay=decay)
-        gen.create_wav_file(wav_path, distorted)
+        # apply_reverb already normalizes anything that would clip
+        gen.create_wav_file(wav_path, distorted, already_normalized=True)
 
         profile_path = os.path.join(temp_dir, "profile.yaml")
         create_t3_profile(profile_path)
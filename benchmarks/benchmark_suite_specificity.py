@@ -12,10 +12,17 @@ import tempfile
 from pathlib import Path
 
 import numpy as np
-from scipy.io import wavfile
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add current dir and src to path
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir))
+sys.path.insert(0, str(current_dir.parent / "src"))
+
+from benchmark_suite import (
+    AudioGenerator,
+    create_t3_profile,
+    generate_t3_pattern,
+)
 
 from acoustic_engine.tester.display import Display
 from acoustic_engine.tester.runner import TestRunner
@@ -24,74 +31,6 @@ from acoustic_engine.tester.runner import TestRunner
 logging.basicConfig(level=logging.ERROR)
 
 
-class AudioGenerator:
-    """Generates synthetic audio files."""
-
-    def __init__(self, sample_rate: int = 44100):
-        self.sample_rate = sample_rate
-
-    def generate_tone(
-        self, frequency: float, duration: float, amplitude: float = 0.5
-    ) -> np.ndarray:
-        t = np.linspace(0, duration, int(self.sample_rate * duration), False)
-        # Generate sine wave
-        tone = np.sin(2 * np.pi * frequency * t) * amplitude
-        return tone
-
-    def generate_silence(self, duration: float) -> np.ndarray:
-        return np.zeros(int(self.sample_rate * duration))
-
-    def generate_noise(self, duration: float, amplitude: float = 0.5) -> np.ndarray:
-        # white noise
-        return np.random.uniform(-amplitude, amplitude, int(self.sample_rate * duration))
-
-    def mix_noise(self, audio: np.ndarray, noise_level: float) -> np.ndarray:
-        if noise_level <= 0:
-            return audio
-
-        noise = np.random.uniform(-noise_level, noise_level, len(audio))
-        return audio + noise
-
-    def create_wav_file(self, filename: str, audio: np.ndarray):
-        # Convert to 16-bit PCM
-        max_val = np.max(np.abs(audio))
-        if max_val > 0:
-            normalized = audio / max_val * 0.9  # Avoid clipping
-        else:
-            normalized = audio
-
-        int_audio = (normalized * 32767).astype(np.int16)
-        wavfile.write(filename, self.sample_rate, int_audio)
-
-
-def generate_t3_pattern(generator: AudioGenerator, frequency: float = 3000) -> np.ndarray:
-    """Generates a T3 pattern (3 beeps)."""
-    # T3: 0.5s ON, 0.5s OFF, 0.5s ON, 0.5s OFF, 0.5s ON, 1.5s OFF
-    tone = generator.generate_tone(frequency, 0.5)
-    short_silence = generator.generate_silence(0.5)
-    long_silence = generator.generate_silence(1.5)
-
-    pattern = np.concatenate([tone, short_silence, tone, short_silence, tone, long_silence])
-
-    # Repeat pattern 3 times
-    return np.concatenate([pattern, pattern, pattern])
-
-
-def generate_fast_t4_pattern(generator: AudioGenerator, frequency: float = 3000) -> np.ndarray:
-    """Generates a fast T4 pattern (4 short beeps)."""
-    # Fast T4: 0.1s ON, 0.1s OFF (x4) then 2.0s OFF
-    tone = generator.generate_tone(frequency, 0.05)  # Very fast 50ms beep
-    silence = generator.generate_silence(0.05)  # Very fast 50ms gap
-    long_silence = generator.generate_silence(2.0)
-
-    unit = np.concatenate([tone, silence])
-    # 4 beeps
-    pattern = np.concatenate([unit, unit, unit, unit, long_silence])
-
-    # Repeat pattern 3 times
-    return np.concatenate([pattern, pattern, pattern])
-
-
 def generate_wrong_freq_t3(generator: AudioGenerator, frequency: float = 1500) -> np.ndarray:
     """Generates T3 pattern but at WRONG frequency (1500Hz vs 3000Hz)."""
     # Same timing, different pitch
@@ -107,113 +46,19 @@ def generate_t3_custom_timing(
 ) -> np.ndarray:
     """Generates a T3 pattern with custom timing."""
     tone = generator.generate_tone(frequency, beep_dur)
-    short_silence = generator.generate_silence(gap_dur)
-    long_silence = generator.generate_silence(long_gap_dur)
+    n_tone = len(tone)
+    n_short = int(generator.sample_rate * gap_dur)
+    n_long = int(generator.sample_rate * long_gap_dur)
 
-    pattern = np.concatenate([tone, short_silence, tone, short_silence, tone, long_silence])
+    # Fill one preallocated buffer instead of concatenating six arrays
+    pattern = np.zeros(3 * n_tone + 2 * n_short + n_long, dtype=tone.dtype)
+    offset = 0
+    for _ in range(3):
+        pattern[offset : offset + n_tone] = tone
+        offset += n_tone + n_short
 
     # Repeat pattern 3 times
-    return np.concatenate([pattern, pattern, pattern])
-
-
-def create_t3_profile(filename: str):
-    profile_content = """
-name: "Benchmark T3"
-segments:
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.4
-      max: 0.6
-  - type: silence
-    duration:
-      min: 0.4
-      max: 0.6
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.4
-      max: 0.6
-  - type: silence
-    duration:
-      min: 0.4
-      max: 0.6
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.4
-      max: 0.6
-  - type: silence
-    duration:
-      min: 1.3
-      max: 1.7
-confirmation_cycles: 2
-"""
-    with open(filename, "w") as f:
-        f.write(profile_content)
-
-
-def create_fast_t4_profile(filename: str):
-    profile_content = """
-name: "Benchmark Fast T4"
-resolution:
-    min_tone_duration: 0.03
-    dropout_tolerance: 0.03
-segments:
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: silence
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: silence
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: silence
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: silence
-    duration:
-      min: 1.5
-      max: 2.5
-confirmation_cycles: 2
-"""
-    with open(filename, "w") as f:
-        f.write(profile_content)
+    return np.tile(pattern, 3)
 
 
 def run_benchmark():
@@ -275,16 +120,27 @@ def run_benchmark():
         else:
             raw_audio = audio_func(gen)
 
+        # Build the runner once per scenario; reset() clears per-run state
+        # between noise levels so the profile is only parsed once
+        runner = TestRunner(
+            profile_path=Path(profile_path), verbose=False, display=Display(verbose=False)
+        )
+
+        # One WAV path per scenario, overwritten per noise level; the final
+        # rmtree cleans it up, so no per-iteration unlink is needed
+        wav_path = os.path.join(temp_dir, "test.wav")
+
+        # |raw + noise| is bounded by raw_peak + noise, so each level's
+        # quantization scale comes from this one scan instead of one per mix
+        raw_peak = max(raw_audio.max(), -raw_audio.min())
+
         for noise in noise_levels:
             # Create Noisy Audio File
-            wav_path = os.path.join(temp_dir, f"test_{noise}.wav")
             mixed_audio = gen.mix_noise(raw_audio, noise)
-            gen.create_wav_file(wav_path, mixed_audio)
+            gen.create_wav_file(wav_path, mixed_audio, peak=raw_peak + noise)
 
             # Run Test
-            display = Display(verbose=False)
-            runner = TestRunner(profile_path=Path(profile_path), verbose=False, display=display)
-
+            runner.reset()
             runner.run_file(Path(wav_path))
 
             match_count = len(runner.results.detections)
@@ -308,9 +164,6 @@ def run_benchmark():
 
             print(f"  Noise {noise * 100:3.0f}% ({snr_str}) | {status} | Matches: {match_count}")
 
-            # Cleanup wav
-            os.remove(wav_path)
-
     # Cleanup
     import shutil
 
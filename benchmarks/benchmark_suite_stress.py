@@ -9,13 +9,23 @@ import logging
 import os
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
-from scipy.io import wavfile
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add current dir and src to path
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir))
+sys.path.insert(0, str(current_dir.parent / "src"))
+
+from benchmark_suite import (
+    AudioGenerator,
+    create_fast_t4_profile,
+    create_t3_profile,
+    generate_fast_t4_pattern,
+    generate_t3_pattern,
+)
 
 from acoustic_engine.tester.display import Display
 from acoustic_engine.tester.runner import TestRunner
@@ -24,172 +34,39 @@ from acoustic_engine.tester.runner import TestRunner
 logging.basicConfig(level=logging.ERROR)
 
 
-class AudioGenerator:
-    """Generates synthetic audio files."""
-
-    def __init__(self, sample_rate: int = 44100):
-        self.sample_rate = sample_rate
-
-    def generate_tone(
-        self, frequency: float, duration: float, amplitude: float = 0.5
-    ) -> np.ndarray:
-        t = np.linspace(0, duration, int(self.sample_rate * duration), False)
-        # Generate sine wave
-        tone = np.sin(2 * np.pi * frequency * t) * amplitude
-        return tone
-
-    def generate_silence(self, duration: float) -> np.ndarray:
-        return np.zeros(int(self.sample_rate * duration))
-
-    def generate_noise(self, duration: float, amplitude: float = 0.5) -> np.ndarray:
-        # white noise
-        return np.random.uniform(-amplitude, amplitude, int(self.sample_rate * duration))
-
-    def mix_noise(self, audio: np.ndarray, noise_level: float) -> np.ndarray:
-        if noise_level <= 0:
-            return audio
-
-        noise = self.generate_noise(len(audio) / self.sample_rate, amplitude=noise_level)
-        return audio + noise
-
-    def create_wav_file(self, filename: str, audio: np.ndarray):
-        # Convert to 16-bit PCM
-        max_val = np.max(np.abs(audio))
-        if max_val > 0:
-            normalized = audio / max_val * 0.9  # Avoid clipping
-        else:
-            normalized = audio
-
-        int_audio = (normalized * 32767).astype(np.int16)
-        wavfile.write(filename, self.sample_rate, int_audio)
-
-
-def generate_t3_pattern(generator: AudioGenerator, frequency: float = 3000) -> np.ndarray:
-    """Generates a T3 pattern (3 beeps)."""
-    # T3: 0.5s ON, 0.5s OFF, 0.5s ON, 0.5s OFF, 0.5s ON, 1.5s OFF
-    tone = generator.generate_tone(frequency, 0.5)
-    short_silence = generator.generate_silence(0.5)
-    long_silence = generator.generate_silence(1.5)
-
-    pattern = np.concatenate([tone, short_silence, tone, short_silence, tone, long_silence])
-
-    # Repeat pattern 3 times
-    return np.concatenate([pattern, pattern, pattern])
-
-
-def generate_fast_t4_pattern(generator: AudioGenerator, frequency: float = 3000) -> np.ndarray:
-    """Generates a fast T4 pattern (4 short beeps)."""
-    # Fast T4: 0.1s ON, 0.1s OFF (x4) then 2.0s OFF
-    tone = generator.generate_tone(frequency, 0.05)  # Very fast 50ms beep
-    silence = generator.generate_silence(0.05)  # Very fast 50ms gap
-    long_silence = generator.generate_silence(2.0)
-
-    unit = np.concatenate([tone, silence])
-    # 4 beeps
-    pattern = np.concatenate([unit, unit, unit, unit, long_silence])
-
-    # Repeat pattern 3 times
-    return np.concatenate([pattern, pattern, pattern])
-
-
-def create_t3_profile(filename: str):
-    profile_content = """
-name: "Benchmark T3"
-segments:
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.4
-      max: 0.6
-  - type: silence
-    duration:
-      min: 0.4
-      max: 0.6
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.4
-      max: 0.6
-  - type: silence
-    duration:
-      min: 0.4
-      max: 0.6
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.4
-      max: 0.6
-  - type: silence
-    duration:
-      min: 1.3
-      max: 1.7
-confirmation_cycles: 2
-"""
-    with open(filename, "w") as f:
-        f.write(profile_content)
-
-
-def create_fast_t4_profile(filename: str):
-    profile_content = """
-name: "Benchmark Fast T4"
-resolution:
-    min_tone_duration: 0.03
-    dropout_tolerance: 0.03
-segments:
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: silence
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: silence
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: silence
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: tone
-    frequency:
-      min: 2900
-      max: 3100
-    duration:
-      min: 0.04
-      max: 0.08
-  - type: silence
-    duration:
-      min: 1.5
-      max: 2.5
-confirmation_cycles: 2
-"""
-    with open(filename, "w") as f:
-        f.write(profile_content)
+# Per-worker state for the parallel noise sweep. Each pool worker builds its
+# own TestRunner and keeps the scenario audio; only the noise level is sent
+# per task, so the full-length arrays are pickled once per worker instead of
+# once per noise level.
+_worker_runner = None
+_worker_raw_audio = None
+_worker_base_noise = None
+_worker_raw_peak = None
+
+
+def _init_noise_worker(profile_path: str, high_res: bool, raw_audio, base_noise):
+    global _worker_runner, _worker_raw_audio, _worker_base_noise, _worker_raw_peak
+    logging.basicConfig(level=logging.ERROR)
+    _worker_runner = TestRunner(
+        profile_path=Path(profile_path),
+        verbose=False,
+        display=Display(verbose=False),
+        high_resolution=high_res,
+    )
+    _worker_raw_audio = raw_audio
+    _worker_base_noise = base_noise
+    _worker_raw_peak = max(raw_audio.max(), -raw_audio.min())
+
+
+def _run_noise_level(noise: float) -> int:
+    """Run one noise level in a pool worker; returns the match count."""
+    _worker_runner.reset()
+    # |raw + noise*base| <= raw_peak + noise (base noise is unit amplitude),
+    # so the quantizer can skip its full-array peak scan
+    _worker_runner.run_array(
+        _worker_raw_audio + _worker_base_noise * noise, peak=_worker_raw_peak + noise
+    )
+    return len(_worker_runner.results.detections)
 
 
 def run_benchmark():
@@ -225,28 +102,23 @@ def run_benchmark():
         # Generate Audio
         raw_audio = audio_func(gen)
 
-        for noise in noise_levels:
-            # Create Noisy Audio File
-            wav_path = os.path.join(temp_dir, f"test_{noise}.wav")
-            mixed_audio = gen.mix_noise(raw_audio, noise)
-            gen.create_wav_file(wav_path, mixed_audio)
-
-            # Run Test
-            display = Display(verbose=False)
-
-            # Determine resolution mode
-            high_res = "High Res" in name
-
-            runner = TestRunner(
-                profile_path=Path(profile_path),
-                verbose=False,
-                display=display,
-                high_resolution=high_res,
-            )
-
-            runner.run_file(Path(wav_path))
-
-            detected = len(runner.results.detections) > 0
+        # Generate unit-amplitude noise once per scenario; each level is then
+        # a fused scale-and-add instead of a full-length RNG pass
+        base_noise = gen.generate_noise(len(raw_audio) / gen.sample_rate, amplitude=1.0)
+
+        # The noise levels are independent, CPU-bound runs, so sweep them in
+        # parallel. map() preserves input order, so results print in the same
+        # order as the sequential loop did.
+        high_res = "High Res" in name
+        with ProcessPoolExecutor(
+            max_workers=min(len(noise_levels), os.cpu_count() or 1),
+            initializer=_init_noise_worker,
+            initargs=(profile_path, high_res, raw_audio, base_noise),
+        ) as executor:
+            match_counts = list(executor.map(_run_noise_level, noise_levels))
+
+        for noise, match_count in zip(noise_levels, match_counts):
+            detected = match_count > 0
             status = "✅ PASS" if detected else "❌ FAIL"
 
             # Calculate SNR (approximate)
@@ -259,12 +131,9 @@ def run_benchmark():
                 snr_str = "Clean     "
 
             print(
-                f"  Noise Level {noise * 100:3.0f}% ({snr_str}) | {status} | Matches: {len(runner.results.detections)}"
+                f"  Noise Level {noise * 100:3.0f}% ({snr_str}) | {status} | Matches: {match_count}"
             )
 
-            # Cleanup wav
-            os.remove(wav_path)
-
     # Cleanup
     import shutil
 
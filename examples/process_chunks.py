@@ -23,9 +23,14 @@ from acoustic_engine.models import AlarmProfile, Range, Segment
 def generate_tone(frequency: float, duration: float, sample_rate: int) -> np.ndarray:
     """Generate a synthetic tone."""
     t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
-    # Sine wave with envelope
-    envelope = np.minimum(1.0, np.minimum(t / 0.01, (duration - t) / 0.01))
-    signal = np.sin(2 * np.pi * frequency * t) * 0.5 * envelope
+    signal = np.sin(2 * np.pi * frequency * t) * 0.5
+    # Fade the first/last 10ms in and out; the envelope is 1.0 everywhere
+    # else, so only the edges need touching
+    ramp = min(int(sample_rate * 0.01), len(signal) // 2)
+    if ramp > 0:
+        fade = np.linspace(0, 1, ramp, dtype=np.float32)
+        signal[:ramp] *= fade
+        signal[-ramp:] *= fade[::-1]
     # Convert to int16
     return (signal * 32767).astype(np.int16)
 
@@ -82,10 +87,12 @@ def main():
     print(f"Total audio length: {len(full_audio) / audio_config.sample_rate:.2f}s")
     print("Processing...")
 
-    # Feed to engine chunk by chunk
+    # Feed to engine chunk by chunk: reshaping to (n_chunks, chunk_size)
+    # lets the loop iterate rows of one 2D view instead of slicing per
+    # iteration
     chunk_size = audio_config.chunk_size
-    for i in range(0, len(full_audio) - chunk_size, chunk_size):
-        chunk = full_audio[i : i + chunk_size]
+    n_chunks = len(full_audio) // chunk_size
+    for chunk in full_audio[: n_chunks * chunk_size].reshape(n_chunks, chunk_size):
         engine.process_chunk(chunk)
 
     print(f"\nDetections: {len(detections)}")
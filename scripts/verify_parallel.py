@@ -28,20 +28,25 @@ def load_audio(path):
         n_channels = wf.getnchannels()
         sampwidth = wf.getsampwidth()
         n_frames = wf.getnframes()
-        audio_data = wf.readframes(n_frames)
 
-        if sampwidth == 2:
-            dtype = np.int16
-        else:
+        if sampwidth != 2:
             raise ValueError("Only 16-bit WAV supported")
 
-        arr = np.frombuffer(audio_data, dtype=dtype).astype(np.float32)
-        arr = arr / 32768.0  # Normalize
-
-        if n_channels > 1:
-            arr = arr.reshape(-1, n_channels)
-            arr = arr[:, 0]
-
+        # Decode in blocks straight into the preallocated float32 output:
+        # readframes(n_frames) would hold a full-file bytes copy alongside
+        # the result, doubling peak memory on long recordings
+        arr = np.empty(n_frames, dtype=np.float32)
+        scale = np.float32(1.0 / 32768.0)
+        block = 1 << 16  # frames per read; bounds the temporary PCM buffer
+        pos = 0
+        while pos < n_frames:
+            raw = np.frombuffer(wf.readframes(min(block, n_frames - pos)), dtype=np.int16)
+            if n_channels > 1:
+                # Strided view picks the first channel without a reshape copy
+                raw = raw[::n_channels]
+            # Fused multiply converts and scales in a single pass
+            np.multiply(raw, scale, out=arr[pos : pos + len(raw)])
+            pos += len(raw)
         return arr
 
 
@@ -75,9 +80,10 @@ def run_test():
 
     engine.on_match = lambda m: detections.append(f"{m.profile_name} @ {m.timestamp:.2f}s")
 
-    for i in range(total_chunks):
-        chunk = audio[i * chunk_size : (i + 1) * chunk_size]
-        engine.process_chunk(chunk)
+    # 2D view over the contiguous float32 buffer; the batch path transforms
+    # many chunks per FFT call instead of one
+    frames = audio[: total_chunks * chunk_size].reshape(-1, chunk_size)
+    engine.process_batch(frames)
 
     print(f"\nResults ({len(detections)} matches):")
     for d in detections:
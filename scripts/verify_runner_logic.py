@@ -1,3 +1,4 @@
+import functools
 import os
 
 import numpy as np
@@ -7,13 +8,21 @@ import yaml
 from acoustic_engine.config import GlobalConfig
 
 
+@functools.lru_cache(maxsize=16)
 def generate_tone(freq, duration, sample_rate=44100, amp=0.5):
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    return (np.sin(2 * np.pi * freq * t) * amp).astype(np.float32)
+    # arange/sr stays in float32 and sidesteps linspace's endpoint math;
+    # the cache means each distinct beep is synthesized once
+    t = np.arange(int(sample_rate * duration), dtype=np.float32) / sample_rate
+    tone = (np.sin(2 * np.pi * freq * t) * amp).astype(np.float32)
+    tone.flags.writeable = False
+    return tone
 
 
+@functools.lru_cache(maxsize=16)
 def generate_silence(duration, sample_rate=44100):
-    return np.zeros(int(sample_rate * duration), dtype=np.float32)
+    sil = np.zeros(int(sample_rate * duration), dtype=np.float32)
+    sil.flags.writeable = False
+    return sil
 
 
 def create_synthetic_audio(filename):
@@ -43,8 +52,12 @@ def create_synthetic_audio(filename):
     print("  - Sequence: T3 Pattern -> T4 Pattern")
     final_audio = np.concatenate([t3_pattern, t3_pattern, t4_pattern, t4_pattern])
 
-    # Normalize and save
-    wavfile.write(filename, sr, (final_audio * 32767).astype(np.int16))
+    # Normalize and save. Quantize straight into the int16 output buffer:
+    # multiplying by a Python int would promote the float32 audio to float64
+    # before the astype copy, doubling peak memory on long audio.
+    int_audio = np.empty(final_audio.shape, dtype=np.int16)
+    np.multiply(final_audio, np.float32(32767), out=int_audio, casting="unsafe")
+    wavfile.write(filename, sr, int_audio)
     print("  - Done.")
 
 
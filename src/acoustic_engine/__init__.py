@@ -12,22 +12,48 @@ Usage:
     engine.start()
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Your Name"
 
-# Core exports
-from .analysis.event_buffer import EventBuffer
-from .analysis.windowed_matcher import WindowedMatcher
-from .config import EngineConfig, compute_finest_resolution
-from .engine import Engine
-from .input.listener import AudioConfig, AudioListener
-from .models import AlarmProfile, Range, ResolutionConfig, Segment
-from .processing.filter import FrequencyFilter
-from .profiles import (
-    load_profile_from_yaml,
-    load_profiles_from_yaml,
-    save_profile_to_yaml,
-)
+# Core exports, resolved lazily (PEP 562): importing the package no longer
+# pulls in numpy/scipy/pyaudio until a consumer actually touches a class
+# that needs them. Tools that only want models or config start in
+# milliseconds instead of paying the full scientific-stack import.
+_LAZY_EXPORTS = {
+    "EventBuffer": ".analysis.event_buffer",
+    "WindowedMatcher": ".analysis.windowed_matcher",
+    "EngineConfig": ".config",
+    "compute_finest_resolution": ".config",
+    "Engine": ".engine",
+    "AudioConfig": ".input.listener",
+    "AudioListener": ".input.listener",
+    "AlarmProfile": ".models",
+    "Range": ".models",
+    "ResolutionConfig": ".models",
+    "Segment": ".models",
+    "FrequencyFilter": ".processing.filter",
+    "load_profile_from_yaml": ".profiles",
+    "load_profiles_from_yaml": ".profiles",
+    "save_profile_to_yaml": ".profiles",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Version
@@ -1,5 +1,6 @@
 """Circular buffer for storing recent audio events for windowed analysis."""
 
+import bisect
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -11,28 +12,40 @@ class EventBuffer:
     """Stores recent audio events for windowed pattern matching.
 
     Maintains a time-ordered list of events, automatically pruning
-    events older than max_duration.
+    events older than max_duration. A parallel timestamp list keeps the
+    events sorted, so pruning and window extraction are bisects plus a
+    slice instead of full rebuilds of the list per call.
     """
 
     max_duration: float = 30.0  # Keep events from last 30s
     _events: List[ToneEvent] = field(default_factory=list)
+    _timestamps: List[float] = field(default_factory=list)
 
     def add(self, event: ToneEvent) -> None:
         """Add an event to the buffer.
 
-        Events are assumed to arrive roughly in order. The buffer
-        automatically prunes old events.
+        Events are assumed to arrive roughly in order (the in-order case
+        is a plain append); stragglers are inserted at their sorted
+        position. The buffer automatically prunes old events.
 
         Args:
             event: ToneEvent to add
         """
-        self._events.append(event)
+        ts = event.timestamp
+        if not self._timestamps or ts >= self._timestamps[-1]:
+            self._events.append(event)
+            self._timestamps.append(ts)
+        else:
+            i = bisect.bisect_right(self._timestamps, ts)
+            self._events.insert(i, event)
+            self._timestamps.insert(i, ts)
 
         # Prune old events (keep those within max_duration of latest)
-        if self._events:
-            latest_time = max(e.timestamp for e in self._events)
-            cutoff = latest_time - self.max_duration
-            self._events = [e for e in self._events if e.timestamp >= cutoff]
+        cutoff = self._timestamps[-1] - self.max_duration
+        i = bisect.bisect_left(self._timestamps, cutoff)
+        if i:
+            del self._events[:i]
+            del self._timestamps[:i]
 
     def get_window(self, end_time: float, window_duration: float) -> List[ToneEvent]:
         """Get all events within a time window.
@@ -45,7 +58,9 @@ class EventBuffer:
             List of events within [end_time - window_duration, end_time]
         """
         start_time = end_time - window_duration
-        return [e for e in self._events if start_time <= e.timestamp <= end_time]
+        lo = bisect.bisect_left(self._timestamps, start_time)
+        hi = bisect.bisect_right(self._timestamps, end_time)
+        return self._events[lo:hi]
 
     def get_events_in_range(
         self,
@@ -63,18 +78,21 @@ class EventBuffer:
             freq_max: Optional maximum frequency filter
 
         Returns:
-            Filtered list of events
+            Filtered list of events, sorted by timestamp
         """
-        events = [e for e in self._events if start_time <= e.timestamp <= end_time]
+        lo = bisect.bisect_left(self._timestamps, start_time)
+        hi = bisect.bisect_right(self._timestamps, end_time)
+        events = self._events[lo:hi]
 
         if freq_min is not None and freq_max is not None:
             events = [e for e in events if freq_min <= e.frequency <= freq_max]
 
-        return sorted(events, key=lambda e: e.timestamp)
+        return events
 
     def clear(self) -> None:
         """Clear all events from the buffer."""
         self._events.clear()
+        self._timestamps.clear()
 
     @property
     def events(self) -> List[ToneEvent]:
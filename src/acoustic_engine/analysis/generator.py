@@ -1,8 +1,9 @@
 """Generates discrete events from continuous DSP data."""
 
+import bisect
 import logging
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from ..events import AudioEvent, ToneEvent
 from ..processing.dsp import Peak
@@ -20,7 +21,7 @@ class ActiveTone:
     last_seen_time: float
     last_strong_time: float  # Last time the signal was above 50% of max
     last_magnitude: float  # Last chunk's magnitude for dip detection
-    samples_count: int
+    matched: bool = False  # Seen in the current chunk (reset each process call)
 
 
 class EventGenerator:
@@ -85,12 +86,29 @@ class EventGenerator:
         self.strong_signal_ratio = strong_signal_ratio
         self.coalesce_ratio = coalesce_ratio
 
-        # State
+        # State. active_tones stays sorted by frequency with _active_freqs
+        # as a parallel key list, so peak matching is a bisect, not a scan.
         self.active_tones: List[ActiveTone] = []
+        self._active_freqs: List[float] = []
+        # Earliest start time among active tones, maintained incrementally
+        # so the release boundary doesn't need an O(T) min() every chunk
+        self._min_active_start: Optional[float] = None
         self.last_process_time = 0.0
 
-        # Buffer for events to ensure chronological output
+        # Buffer for events to ensure chronological output, with a parallel
+        # timestamp list (same pattern as _active_freqs) so inserts and the
+        # release split are plain bisects.
         self.pending_output: List[ToneEvent] = []
+        self._pending_timestamps: List[float] = []
+
+    def reset(self) -> None:
+        """Reset all state."""
+        self.active_tones = []
+        self._active_freqs = []
+        self._min_active_start = None
+        self.pending_output = []
+        self._pending_timestamps = []
+        self.last_process_time = 0.0
 
     def process(self, peaks: List[Peak], timestamp: float) -> List[AudioEvent]:
         """Process spectral peaks for a time slice and return completed events.
@@ -106,32 +124,67 @@ class EventGenerator:
             emitted *after* they have finished (and the dropout tolerance timer
             has expired), so there is inherent latency equal to `dropout_tolerance`.
         """
-        # 1. Update active tones
-        current_active_indices = set()
+        # Fast path: silence is the overwhelmingly common case for an alarm
+        # detector. With no peaks and no active tones there is nothing to
+        # match or expire; anything still pending has no active tone holding
+        # it back, so it flushes and later calls return immediately.
+        if not peaks and not self.active_tones:
+            self.last_process_time = timestamp
+            self._min_active_start = None
+            if not self.pending_output:
+                return []
+            ready = self.pending_output
+            self.pending_output = []
+            self._pending_timestamps = []
+            return self._coalesce_ready(ready)
+
+        # 1. Update active tones. The tones are kept sorted by frequency
+        # (self._active_freqs mirrors them), so each peak finds its match
+        # with one bisect plus two neighbor checks instead of scanning
+        # every active tone. Hot attributes are hoisted to locals: this
+        # method runs per chunk, and LOAD_FAST beats repeated LOAD_ATTR.
+        active_tones = self.active_tones
+        active_freqs = self._active_freqs
+        tolerance = self.frequency_tolerance
+        smoothing = self.freq_smoothing
+        dip_threshold = self.dip_threshold
+        strong_ratio = self.strong_signal_ratio
+        bisect_left = bisect.bisect_left
+
+        for tone in active_tones:
+            tone.matched = False
 
         for peak in peaks:
+            pos = bisect_left(active_freqs, peak.frequency)
+
+            # The nearest tone by frequency is one of the two neighbors of
+            # the insertion point; pick whichever is inside the tolerance
+            best = -1
+            best_dist = tolerance
+            for j in (pos - 1, pos):
+                if 0 <= j < len(active_freqs):
+                    dist = abs(active_freqs[j] - peak.frequency)
+                    if dist < best_dist:
+                        best_dist = dist
+                        best = j
+
             matched = False
-            for i, tone in enumerate(self.active_tones):
-                if abs(peak.frequency - tone.frequency) < self.frequency_tolerance:
+            if best >= 0:
+                tone = active_tones[best]
+
+                # Upgrade: Instantaneous Dip Detection (Grandmaster feature)
+                # If magnitude drops by >40% compared to PREVIOUS chunk,
+                # we are likely entering the reverb tail, so we force a
+                # disconnect and let the peak start a fresh tone below.
+                magnitude_ratio = peak.magnitude / (
+                    tone.last_magnitude if tone.last_magnitude > 0 else 1.0
+                )
+
+                if magnitude_ratio >= dip_threshold:
                     # 2. Track frequency history/smoothing
-                    tone.frequency = (
-                        1.0 - self.freq_smoothing
-                    ) * tone.frequency + self.freq_smoothing * peak.frequency
-
-                    # Upgrade: Instantaneous Dip Detection (Grandmaster feature)
-                    # If magnitude drops by >40% compared to PREVIOUS chunk,
-                    # we are likely entering the reverb tail.
-                    magnitude_ratio = peak.magnitude / (
-                        tone.last_magnitude if tone.last_magnitude > 0 else 1.0
-                    )
-
-                    if magnitude_ratio < self.dip_threshold:
-                        # Significant dip - This is likely the end of the beep and start of reverb.
-                        # We force a disconnect here so the beep duration isn't stretched.
-                        matched = False
-                        break
-
-                    if peak.magnitude > tone.max_magnitude * self.strong_signal_ratio:
+                    tone.frequency = (1.0 - smoothing) * tone.frequency + smoothing * peak.frequency
+
+                    if peak.magnitude > tone.max_magnitude * strong_ratio:
                         # Signal is still strong and consistent
                         tone.last_strong_time = timestamp
 
@@ -140,10 +193,16 @@ class EventGenerator:
 
                     tone.last_magnitude = peak.magnitude  # Track for NEXT dip check
                     tone.last_seen_time = timestamp
-                    tone.samples_count += 1
-                    current_active_indices.add(i)
+                    tone.matched = True
                     matched = True
-                    break
+
+                    # Smoothing moved the tone's frequency, so reposition it
+                    # to keep the parallel arrays sorted
+                    active_tones.pop(best)
+                    active_freqs.pop(best)
+                    new_pos = bisect_left(active_freqs, tone.frequency)
+                    active_tones.insert(new_pos, tone)
+                    active_freqs.insert(new_pos, tone.frequency)
 
             if not matched:
                 # New potential tone
@@ -154,30 +213,47 @@ class EventGenerator:
                     last_seen_time=timestamp,
                     last_strong_time=timestamp,
                     last_magnitude=peak.magnitude,
-                    samples_count=1,
                 )
-                self.active_tones.append(new_tone)
-                current_active_indices.add(len(self.active_tones) - 1)
-
-        # 2. Check for ended tones
-        active_tones_next: List[ActiveTone] = []
+                new_pos = bisect_left(active_freqs, peak.frequency)
+                new_tone.matched = True
+                active_tones.insert(new_pos, new_tone)
+                active_freqs.insert(new_pos, peak.frequency)
+                # Timestamps only move forward, so a new tone can only set
+                # the minimum when there was none
+                if self._min_active_start is None:
+                    self._min_active_start = timestamp
+
+        # 2. Check for ended tones. Survivors are compacted in place with a
+        # write index, so no replacement lists are allocated per chunk;
+        # frequency order is preserved, keeping the arrays sorted.
         new_events: List[ToneEvent] = []
-
-        for i, tone in enumerate(self.active_tones):
-            if i in current_active_indices:
-                active_tones_next.append(tone)
+        dropped_min = False
+        write = 0
+        dropout_tolerance = self.dropout_tolerance
+        chunk_duration = self.chunk_duration
+        min_tone_duration = self.min_tone_duration
+        min_active_start = self._min_active_start
+
+        for tone in active_tones:
+            if tone.matched:
+                active_tones[write] = tone
+                active_freqs[write] = tone.frequency
+                write += 1
             else:
                 time_since_seen = timestamp - tone.last_seen_time
 
-                if time_since_seen > self.dropout_tolerance:
+                if time_since_seen > dropout_tolerance:
+                    if tone.start_time == min_active_start:
+                        dropped_min = True
+
                     # Tone ended - Use 'last_strong_time' for precision duration (Elite feature)
                     # This cuts off the reverb tail and restores the true pattern rhythm.
-                    duration = (tone.last_strong_time - tone.start_time) + self.chunk_duration
+                    duration = (tone.last_strong_time - tone.start_time) + chunk_duration
 
                     # Safety check: ensure duration is at least one chunk
-                    duration = max(self.chunk_duration, duration)
+                    duration = max(chunk_duration, duration)
 
-                    if duration >= self.min_tone_duration:
+                    if duration >= min_tone_duration:
                         event = ToneEvent(
                             timestamp=tone.start_time,
                             duration=duration,
@@ -187,20 +263,37 @@ class EventGenerator:
                         )
                         new_events.append(event)
                         logger.debug(
-                            f"Generated Tone: {event.frequency:.0f}Hz, {event.duration:.2f}s"
+                            "Generated Tone: %.0fHz, %.2fs", event.frequency, event.duration
                         )
                 else:
                     # Keep waiting (dropout tolerance)
-                    active_tones_next.append(tone)
-
-        self.active_tones = active_tones_next
+                    active_tones[write] = tone
+                    active_freqs[write] = tone.frequency
+                    write += 1
+
+        del active_tones[write:]
+        del active_freqs[write:]
+        # Refresh the cached minimum only when the holder was dropped
+        if not active_tones:
+            self._min_active_start = None
+        elif dropped_min:
+            self._min_active_start = min(t.start_time for t in active_tones)
         self.last_process_time = timestamp
 
-        # 3. Add new events to pending output buffer
-        if new_events:
-            self.pending_output.extend(new_events)
-            # Sort pending events by start time
-            self.pending_output.sort(key=lambda e: e.timestamp)
+        # Nothing finished and the release boundary didn't move, so no
+        # pending event can have become releasable since the last call;
+        # skip the merge/release/coalesce steps entirely. This is the
+        # steady state while a long tone is in progress.
+        if not new_events and not dropped_min and self.active_tones:
+            return []
+
+        # 3. Add new events to pending output buffer. The buffer is already
+        # sorted by start time, so merging the handful of new events with
+        # insort beats re-sorting the whole list every chunk.
+        for event in new_events:
+            i = bisect.bisect_right(self._pending_timestamps, event.timestamp)
+            self.pending_output.insert(i, event)
+            self._pending_timestamps.insert(i, event.timestamp)
 
         # 4. Safe Release Logic:
         # We can only release events that started BEFORE the oldest active tone's start time.
@@ -213,50 +306,58 @@ class EventGenerator:
             # No active tones -> Safe to release everything
             ready_events = self.pending_output
             self.pending_output = []
+            self._pending_timestamps = []
         else:
-            # Find the oldest start time among active tones
-            min_active_start = min(t.start_time for t in self.active_tones)
-
-            # Release events that definitely happen before any potential new event
-            # (Note: allowing a small margin for float equality)
-            split_idx = 0
-            for i, event in enumerate(self.pending_output):
-                if event.timestamp < min_active_start:
-                    split_idx = i + 1
-                else:
-                    break
+            # Oldest start time among active tones, tracked incrementally
+            min_active_start = self._min_active_start
+
+            # Release events that definitely happen before any potential new
+            # event; the buffer is sorted, so the boundary is a bisect away
+            split_idx = bisect.bisect_left(self._pending_timestamps, min_active_start)
 
             if split_idx > 0:
                 ready_events = self.pending_output[:split_idx]
                 self.pending_output = self.pending_output[split_idx:]
+                self._pending_timestamps = self._pending_timestamps[split_idx:]
 
         # 5. Coalesce overlapping ready events
-        if len(ready_events) > 1:
-            coalesced_events = []
-
-            if ready_events:
-                current_event = ready_events[0]
-
-                for next_event in ready_events[1:]:
-                    # Check for overlap
-                    current_end = current_event.timestamp + current_event.duration
-                    next_start = next_event.timestamp
-
-                    # If they overlap significantly (more than 50% of the shorter one)
-                    overlap = max(
-                        0, min(current_end, next_event.timestamp + next_event.duration) - next_start
-                    )
-                    min_dur = min(current_event.duration, next_event.duration)
-
-                    if overlap > self.coalesce_ratio * min_dur:
-                        # Overlap detected - coalescing
-                        if next_event.duration > current_event.duration:
-                            current_event = next_event
-                    else:
-                        coalesced_events.append(current_event)
-                        current_event = next_event
+        return self._coalesce_ready(ready_events)
+
+    def _coalesce_ready(self, ready_events: List[ToneEvent]) -> List[ToneEvent]:
+        """Merge ready events that overlap significantly in time.
 
+        Sweep-line merge over the already start-sorted events: the running
+        end time and durations are carried between iterations, so each step
+        is one overlap comparison. Durations are positive, so a negative
+        overlap (disjoint events) simply fails the ratio test.
+        """
+        if len(ready_events) <= 1:
+            return ready_events
+
+        coalesced_events = []
+        current_event = ready_events[0]
+        current_end = current_event.timestamp + current_event.duration
+        current_dur = current_event.duration
+
+        for next_event in ready_events[1:]:
+            next_dur = next_event.duration
+            next_end = next_event.timestamp + next_dur
+
+            # Overlap significant when more than coalesce_ratio of the
+            # shorter event is covered
+            overlap = min(current_end, next_end) - next_event.timestamp
+
+            if overlap > self.coalesce_ratio * min(current_dur, next_dur):
+                # Overlap detected - keep the longer of the two
+                if next_dur > current_dur:
+                    current_event = next_event
+                    current_end = next_end
+                    current_dur = next_dur
+            else:
                 coalesced_events.append(current_event)
-                ready_events = coalesced_events
+                current_event = next_event
+                current_end = next_end
+                current_dur = next_dur
 
-        return ready_events
+        coalesced_events.append(current_event)
+        return coalesced_events
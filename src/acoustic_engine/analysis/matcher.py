@@ -8,6 +8,10 @@ from ..models import AlarmProfile
 
 logger = logging.getLogger(__name__)
 
+# Shared empty result for the no-match case (the overwhelming majority of
+# events); callers must treat returned lists as read-only
+_NO_MATCHES: List[PatternMatchEvent] = []
+
 
 class MatcherState:
     """Tracks progress of a single profile match."""
@@ -77,14 +81,16 @@ class SequenceMatcher:
             List of PatternMatchEvent objects for any profiles that completed
             their full pattern match sequence with this event.
         """
-        matches = []
+        matches = None
 
         for profile in self.profiles:
             match_event = self._update_profile(self.states[profile.name], event)
             if match_event:
+                if matches is None:
+                    matches = []
                 matches.append(match_event)
 
-        return matches
+        return matches if matches is not None else _NO_MATCHES
 
     def _update_profile(
         self, state: MatcherState, event: AudioEvent
@@ -113,7 +119,7 @@ class SequenceMatcher:
             # This filters out ambient noise that would break pattern matching
             if not state.is_relevant_frequency(event.frequency):
                 # This tone is outside all expected ranges - ignore it completely
-                logger.debug(f"[{p.name}] Ignoring out-of-band tone: {event.frequency:.0f}Hz")
+                logger.debug("[%s] Ignoring out-of-band tone: %.0fHz", p.name, event.frequency)
                 return None
 
             # Check silence gap before this tone
@@ -135,8 +141,10 @@ class SequenceMatcher:
                         if prev_seg.frequency.contains(event.frequency):
                             # This is likely a parallel detection of the previous tone
                             logger.debug(
-                                f"[{p.name}] Merging overlapping tone: {event.frequency:.0f}Hz "
-                                f"(gap {gap_duration:.2f}s)"
+                                "[%s] Merging overlapping tone: %.0fHz (gap %.2fs)",
+                                p.name,
+                                event.frequency,
+                                gap_duration,
                             )
                             # Extend the last event time if this one lasts longer
                             state.last_event_time = max(
@@ -146,13 +154,16 @@ class SequenceMatcher:
 
                 if expected.duration.contains(gap_duration):
                     state.current_segment_index += 1
-                    logger.debug(f"[{p.name}] Silence matched: {gap_duration:.2f}s")
+                    logger.debug("[%s] Silence matched: %.2fs", p.name, gap_duration)
 
                     if state.current_segment_index >= len(p.segments):
                         state.cycle_count += 1
                         state.current_segment_index = 0
                         logger.debug(
-                            f"[{p.name}] Cycle {state.cycle_count}/{p.confirmation_cycles} complete"
+                            "[%s] Cycle %d/%d complete",
+                            p.name,
+                            state.cycle_count,
+                            p.confirmation_cycles,
                         )
 
                         if state.cycle_count >= p.confirmation_cycles:
@@ -168,8 +179,11 @@ class SequenceMatcher:
                 else:
                     if state.current_segment_index > 0:
                         logger.debug(
-                            f"[{p.name}] Reset: Gap {gap_duration:.2f}s doesn't match "
-                            f"expected {expected.duration.min:.2f}-{expected.duration.max:.2f}s"
+                            "[%s] Reset: Gap %.2fs doesn't match expected %.2f-%.2fs",
+                            p.name,
+                            gap_duration,
+                            expected.duration.min,
+                            expected.duration.max,
                         )
                         state.reset()
                         expected = p.segments[0]
@@ -183,14 +197,20 @@ class SequenceMatcher:
                 if freq_match and dur_match:
                     is_match = True
                     logger.debug(
-                        f"[{p.name}] Tone matched step {state.current_segment_index}: "
-                        f"{event.frequency:.0f}Hz, {event.duration:.2f}s"
+                        "[%s] Tone matched step %d: %.0fHz, %.2fs",
+                        p.name,
+                        state.current_segment_index,
+                        event.frequency,
+                        event.duration,
                     )
                 elif freq_match and not dur_match:
                     # Frequency matches but duration doesn't - reset
                     logger.debug(
-                        f"[{p.name}] Duration mismatch: got {event.duration:.2f}s, "
-                        f"expected {expected.duration.min:.2f}-{expected.duration.max:.2f}s"
+                        "[%s] Duration mismatch: got %.2fs, expected %.2f-%.2fs",
+                        p.name,
+                        event.duration,
+                        expected.duration.min,
+                        expected.duration.max,
                     )
                     if state.current_segment_index > 0:
                         state.reset()
@@ -213,7 +233,10 @@ class SequenceMatcher:
                     state.cycle_count += 1
                     state.current_segment_index = 0
                     logger.debug(
-                        f"[{p.name}] Cycle {state.cycle_count}/{p.confirmation_cycles} complete"
+                        "[%s] Cycle %d/%d complete",
+                        p.name,
+                        state.cycle_count,
+                        p.confirmation_cycles,
                     )
 
                     if state.cycle_count >= p.confirmation_cycles:
@@ -2,6 +2,8 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from ..events import PatternMatchEvent, ToneEvent
 from ..models import AlarmProfile
 from .event_buffer import EventBuffer
@@ -64,6 +66,13 @@ class WindowedMatcher:
         self.last_eval_times: Dict[str, float] = {}
         self.cycle_counts: Dict[str, int] = {}
         self.last_match_times: Dict[str, float] = {}  # Prevent duplicate detections
+        # Per-profile frequency bounds as parallel (mins, maxs) arrays so
+        # event filtering is a vectorized mask instead of nested loops
+        self._freq_bounds: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        # Segments split by type once; _count_pattern_cycles runs per
+        # start candidate and shouldn't re-partition the profile each time
+        self._tone_segs: Dict[str, Tuple] = {}
+        self._silence_segs: Dict[str, Tuple] = {}
 
         for profile in profiles:
             config = self._compute_config(profile)
@@ -72,6 +81,20 @@ class WindowedMatcher:
             self.cycle_counts[profile.name] = 0
             self.last_match_times[profile.name] = -999.0  # Long ago
 
+            ranges = [
+                (seg.frequency.min, seg.frequency.max)
+                for seg in profile.segments
+                if seg.type == "tone" and seg.frequency
+            ]
+            self._freq_bounds[profile.name] = (
+                np.array([r[0] for r in ranges]),
+                np.array([r[1] for r in ranges]),
+            )
+            self._tone_segs[profile.name] = tuple(s for s in profile.segments if s.type == "tone")
+            self._silence_segs[profile.name] = tuple(
+                s for s in profile.segments if s.type == "silence"
+            )
+
             logger.debug(
                 f"[{profile.name}] Window config: duration={config.window_duration:.1f}s, "
                 f"eval_freq={config.eval_frequency:.2f}s, pattern={config.pattern_duration:.2f}s"
@@ -123,7 +146,7 @@ class WindowedMatcher:
             event: ToneEvent object from the EventGenerator.
         """
         self.event_buffer.add(event)
-        logger.debug(f"Buffered event: {event.frequency:.0f}Hz at t={event.timestamp:.2f}s")
+        logger.debug("Buffered event: %.0fHz at t=%.2fs", event.frequency, event.timestamp)
 
     def evaluate(self, current_time: float) -> List[PatternMatchEvent]:
         """Evaluate all profiles against the current event buffer.
@@ -188,38 +211,39 @@ class WindowedMatcher:
         """
         config = self.configs[profile.name]
 
-        # Build list of valid frequency ranges from profile
-        freq_ranges: List[Tuple[float, float]] = []
-        for seg in profile.segments:
-            if seg.type == "tone" and seg.frequency:
-                freq_ranges.append((seg.frequency.min, seg.frequency.max))
-
-        if not freq_ranges:
+        fmins, fmaxs = self._freq_bounds[profile.name]
+        if fmins.size == 0:
             return None
 
-        # Filter events to only those in valid frequency ranges
-        relevant_events = []
-        for event in events:
-            for fmin, fmax in freq_ranges:
-                if fmin <= event.frequency <= fmax:
-                    relevant_events.append(event)
-                    break
-
-        if not relevant_events:
+        # Filter events to those in any valid frequency range with one
+        # vectorized mask per range instead of a Python loop per event
+        freqs = np.fromiter((e.frequency for e in events), np.float64, count=len(events))
+        in_any = np.zeros(len(events), dtype=bool)
+        for fmin, fmax in zip(fmins, fmaxs):
+            in_any |= (freqs >= fmin) & (freqs <= fmax)
+        if not in_any.any():
             return None
+        relevant_events = [events[i] for i in np.flatnonzero(in_any)]
 
         # Sort by timestamp
         relevant_events.sort(key=lambda e: e.timestamp)
 
         logger.debug(
-            f"[{profile.name}] Evaluating {len(relevant_events)} relevant events in window"
+            "[%s] Evaluating %d relevant events in window", profile.name, len(relevant_events)
         )
 
         # Try to find pattern starting from each event
         best_cycles = 0
-
-        for start_idx in range(len(relevant_events)):
-            cycles = self._count_pattern_cycles(relevant_events[start_idx:], profile)
+        n_events = len(relevant_events)
+        segs_per_cycle = len(self._tone_segs[profile.name])
+
+        for start_idx in range(n_events):
+            # Each matched cycle consumes at least one event per tone
+            # segment, so the events remaining bound the achievable cycle
+            # count; once no later start can beat best_cycles, stop.
+            if (n_events - start_idx) // segs_per_cycle <= best_cycles:
+                break
+            cycles = self._count_pattern_cycles(relevant_events, profile, start_idx)
             if cycles > best_cycles:
                 best_cycles = cycles
 
@@ -228,12 +252,12 @@ class WindowedMatcher:
             # Prevent duplicate detections (must be at least pattern_duration since last)
             last_match = self.last_match_times[profile.name]
             if current_time - last_match < config.pattern_duration:
-                logger.debug(f"[{profile.name}] Suppressing duplicate detection")
+                logger.debug("[%s] Suppressing duplicate detection", profile.name)
                 return None
 
             self.last_match_times[profile.name] = current_time
 
-            logger.info(f"[{profile.name}] Pattern matched! {best_cycles} cycles found")
+            logger.info("[%s] Pattern matched! %d cycles found", profile.name, best_cycles)
 
             return PatternMatchEvent(
                 timestamp=current_time,
@@ -248,28 +272,31 @@ class WindowedMatcher:
         self,
         events: List[ToneEvent],
         profile: AlarmProfile,
+        start: int = 0,
     ) -> int:
-        """Count how many complete pattern cycles match from the start.
+        """Count how many complete pattern cycles match from a start position.
 
         Args:
             events: Sequence of events to check (already filtered by frequency)
             profile: Profile defining the pattern
+            start: Index in events to begin matching from (avoids the
+                per-candidate list slice when scanning start positions)
 
         Returns:
             Number of complete cycles matched
         """
-        if not events:
+        if start >= len(events):
             return 0
 
-        # Extract tone segments from profile
-        tone_segments = [s for s in profile.segments if s.type == "tone"]
-        silence_segments = [s for s in profile.segments if s.type == "silence"]
+        # Segment partitions are precomputed per profile in __init__
+        tone_segments = self._tone_segs[profile.name]
+        silence_segments = self._silence_segs[profile.name]
 
         if not tone_segments:
             return 0
 
         cycle_count = 0
-        event_idx = 0
+        event_idx = start
 
         # Try to match complete cycles
         while event_idx < len(events):
@@ -288,6 +315,13 @@ class WindowedMatcher:
                 skipped_noise = 0
                 max_skip = self.noise_skip_limit
 
+                # Bind the segment's bounds once; the retry loop re-tests
+                # them per skipped event and Range.contains would pay a
+                # method dispatch plus attribute loads on every compare
+                freq_range = tone_seg.frequency
+                dur_min = tone_seg.duration.min * self.duration_relax_low
+                dur_max = tone_seg.duration.max * self.duration_relax_high
+
                 while skipped_noise <= max_skip:
                     if temp_idx >= len(events):
                         break
@@ -295,11 +329,9 @@ class WindowedMatcher:
                     event = events[temp_idx]
 
                     # 1. Check Frequency
-                    freq_match = tone_seg.frequency and tone_seg.frequency.contains(event.frequency)
+                    freq_match = freq_range and freq_range.min <= event.frequency <= freq_range.max
 
                     # 2. Check Duration (flexible but not too loose)
-                    dur_min = tone_seg.duration.min * self.duration_relax_low
-                    dur_max = tone_seg.duration.max * self.duration_relax_high
                     dur_match = dur_min <= event.duration <= dur_max
 
                     if freq_match and dur_match:
@@ -337,7 +369,7 @@ class WindowedMatcher:
 
             if cycle_matched:
                 cycle_count += 1
-                logger.debug(f"[{profile.name}] Cycle {cycle_count} matched")
+                logger.debug("[%s] Cycle %d matched", profile.name, cycle_count)
                 # Advance the main event pointer to where this cycle ended
                 event_idx = temp_idx
             else:
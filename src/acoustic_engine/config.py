@@ -12,10 +12,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
-import yaml
-
 from .models import AlarmProfile, ResolutionConfig
-from .profiles import _parse_profile, load_profiles_from_yaml
+from .profiles import _parse_profile, _read_yaml, load_profiles_from_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -339,8 +337,7 @@ class GlobalConfig:
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {path}")
 
-        with open(path, "r") as f:
-            data = yaml.safe_load(f) or {}
+        data = _read_yaml(path) or {}
 
         # 1. Parse System Config
         sys_data = data.get("system", {})
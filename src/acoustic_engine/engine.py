@@ -79,9 +79,13 @@ class Engine:
 
         # State management
         self._alarm_active = False
+        self._alarm_clear_at = 0.0
         self._current_time = 0.0
         self._running = False
 
+        # Fixed for the engine's lifetime; computed once rather than per chunk
+        self._chunk_duration = self.engine_config.chunk_size / self.engine_config.sample_rate
+
         # Pipeline components initialization
         self._dsp = SpectralMonitor(
             self.engine_config.sample_rate,
@@ -167,12 +171,20 @@ class Engine:
             True if an alarm was detected and triggered in this specific chunk.
         """
         # Time keeping based on configured chunk size (which dictates temporal resolution)
-        chunk_duration = self.engine_config.chunk_size / self.engine_config.sample_rate
-        self._current_time += chunk_duration
+        self._current_time += self._chunk_duration
 
         # 1. DSP Analysis: Convert time-domain audio to frequency peaks
         peaks = self._dsp.process(audio_chunk)
 
+        return bool(self._process_peaks(peaks))
+
+    def _process_peaks(self, peaks) -> List[PatternMatchEvent]:
+        """Run the post-DSP pipeline stages for one chunk's peaks."""
+        # Expire the alarm cooldown inline rather than from a timer thread
+        if self._alarm_active and time.monotonic() >= self._alarm_clear_at:
+            logger.info("Auto-clearing alarm state.")
+            self._alarm_active = False
+
         # 2. Frequency Filter: Remove irrelevant frequencies early for performance
         filtered_peaks = self._freq_filter.filter_peaks(peaks)
 
@@ -184,13 +196,61 @@ class Engine:
             self._matcher.add_event(event)
 
         # Evaluate windows
-        detected = False
         matches = self._matcher.evaluate(self._current_time)
         for match in matches:
             self._trigger_alarm(match)
-            detected = True
 
-        return detected
+        return matches
+
+    def process_batch(self, audio_chunks: np.ndarray) -> int:
+        """Process pre-chunked audio through the pipeline in one call.
+
+        Intended for audio that is already split into chunks, e.g. a
+        recording reshaped to ``(n_chunks, chunk_size)``. The FFT for all
+        rows runs as one batched transform; event generation and matching
+        then proceed chunk by chunk, so results match process_chunk exactly.
+
+        Args:
+            audio_chunks: 2D array of raw audio samples, one chunk per row.
+
+        Returns:
+            Number of chunks that triggered an alarm detection.
+        """
+        detected_chunks = 0
+        process_peaks = self._process_peaks
+        for peaks in self._dsp.process_batch(audio_chunks):
+            self._current_time += self._chunk_duration
+            if process_peaks(peaks):
+                detected_chunks += 1
+        return detected_chunks
+
+    def process_chunks(self, audio: np.ndarray) -> List[PatternMatchEvent]:
+        """Process a flat recording offline and return every pattern match.
+
+        Convenience wrapper over process_batch for replay/analysis of a
+        whole recording: the audio is split into configured-size chunks
+        (any trailing partial chunk is dropped, matching the live path)
+        and run through the batched FFT, collecting the PatternMatchEvents
+        from every chunk rather than just a detection count.
+
+        Args:
+            audio: 1D array of raw audio samples (int16, mono).
+
+        Returns:
+            All pattern matches, in chronological order.
+        """
+        chunk_size = self.engine_config.chunk_size
+        n_chunks = len(audio) // chunk_size
+        if n_chunks == 0:
+            return []
+        frames = audio[: n_chunks * chunk_size].reshape(n_chunks, chunk_size)
+
+        all_matches: List[PatternMatchEvent] = []
+        process_peaks = self._process_peaks
+        for peaks in self._dsp.process_batch(frames):
+            self._current_time += self._chunk_duration
+            all_matches.extend(process_peaks(peaks))
+        return all_matches
 
     def _trigger_alarm(self, match: PatternMatchEvent) -> None:
         """Handle a confirmed pattern match detection.
@@ -200,7 +260,7 @@ class Engine:
         Args:
             match: The PatternMatchEvent detailing the detection.
         """
-        logger.info(f"MATCH: {match.profile_name} (Cycle {match.cycle_count})")
+        logger.info("MATCH: %s (Cycle %d)", match.profile_name, match.cycle_count)
 
         if not self._alarm_active:
             logger.critical("=" * 60)
@@ -223,14 +283,10 @@ class Engine:
                 except Exception as e:
                     logger.error(f"Error in on_match callback: {e}")
 
-            # Auto-reset after timeout to allow new detections
-            def clear():
-                time.sleep(10)  # Hardcoded cooldown for now
-                if self._alarm_active:
-                    logger.info("Auto-clearing alarm state.")
-                    self._alarm_active = False
-
-            threading.Thread(target=clear, daemon=True).start()
+            # Auto-reset after timeout to allow new detections. The
+            # deadline is checked at the top of process_chunk; no timer
+            # thread per alarm.
+            self._alarm_clear_at = time.monotonic() + 10.0  # Hardcoded cooldown for now
 
     def start(self) -> None:
         """Start the engine with built-in audio capture (blocking).
@@ -6,6 +6,7 @@ audio chunks, abstracting away the complexity of stream management.
 """
 
 import logging
+import queue
 from typing import Callable, Optional
 
 import numpy as np
@@ -56,6 +57,10 @@ class AudioListener:
         self._pyaudio: Optional["pyaudio.PyAudio"] = None
         self._stream = None
         self._running = False
+        # Capture queue filled by the PortAudio callback thread and drained
+        # by start(). SimpleQueue.put_nowait is reentrant-safe, so it is
+        # safe to call from the audio callback.
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
 
     def setup(self) -> bool:
         """Initialize PyAudio and open the audio stream.
@@ -85,6 +90,7 @@ class AudioListener:
                 input=True,
                 input_device_index=self.config.device_index,
                 frames_per_buffer=self.config.chunk_size,
+                stream_callback=self._pa_callback,
             )
             logger.info("✅ Audio stream opened successfully")
             return True
@@ -146,12 +152,27 @@ class AudioListener:
             logger.error(f"Could not list devices: {e}")
         logger.info("-" * 40)
 
-    def start(self) -> None:
-        """Start the audio capture loop (blocking).
+    def _pa_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio stream callback: hand the captured chunk to the queue.
+
+        Runs on PortAudio's capture thread, so it must return quickly; the
+        DSP work happens on the start() thread. Overflows are logged rather
+        than silently swallowed.
+        """
+        if status & pyaudio.paInputOverflow:
+            logger.warning("Audio input overflow - samples were dropped by the driver")
+        self._queue.put_nowait(np.frombuffer(in_data, dtype=np.int16))
+        return (None, pyaudio.paContinue)
 
-        This method enters a loop that continuously reads from the audio stream
-        and relays data to the callback. It blocks the calling thread until
-        stop() is called or an error occurs.
+    def start(self) -> None:
+        """Start the audio processing loop (blocking).
+
+        Capture happens on PortAudio's callback thread, which only enqueues
+        raw chunks; this loop drains the queue and relays chunks to the
+        callback. Decoupling capture from DSP means a slow downstream
+        pipeline backs up the queue instead of overflowing the driver
+        buffer. Blocks the calling thread until stop() is called or an
+        error occurs.
         """
         if not self._stream:
             logger.error("Audio stream not initialized. Call setup() first.")
@@ -162,9 +183,9 @@ class AudioListener:
 
         try:
             while self._running:
-                # exception_on_overflow=False prevents crashes on transient buffer overruns
-                audio_data = self._stream.read(self.config.chunk_size, exception_on_overflow=False)
-                audio_chunk = np.frombuffer(audio_data, dtype=np.int16)
+                audio_chunk = self._queue.get()
+                if audio_chunk is None:  # Sentinel from stop()
+                    break
                 self.on_audio_chunk(audio_chunk)
 
         except Exception as e:
@@ -172,11 +193,13 @@ class AudioListener:
                 logger.error(f"Error in audio capture loop: {e}", exc_info=True)
 
     def stop(self) -> None:
-        """Stop the audio capture loop.
+        """Stop the audio processing loop.
 
-        This sets a flag that will cause the start() loop to exit cleanly.
+        Clears the running flag and wakes the start() loop with a sentinel
+        so it exits even when no audio is arriving.
         """
         self._running = False
+        self._queue.put_nowait(None)
         logger.info("🛑 Listener stopping...")
 
     def cleanup(self) -> None:
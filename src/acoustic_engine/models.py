@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import List, Literal, Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class Range:
     """A numeric range (min, max)."""
 
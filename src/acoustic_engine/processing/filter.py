@@ -1,9 +1,11 @@
 """Frequency filter for pre-filtering spectral peaks."""
 
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
 
 from ..models import AlarmProfile
-from .dsp import Peak
+from .dsp import Peak, PeakArray
 
 
 class FrequencyFilter:
@@ -81,19 +83,48 @@ class FrequencyFilter:
                 return True
         return False
 
-    def filter_peaks(self, peaks: List[Peak]) -> List[Peak]:
-        """Filter a list of peaks to only include relevant frequencies.
+    def make_mask(self, frequencies: np.ndarray) -> np.ndarray:
+        """Build a boolean relevance mask over an array of frequencies.
 
         Args:
-            peaks: List of Peak objects from DSP
+            frequencies: 1D array of frequencies in Hz
 
         Returns:
-            Filtered list containing only peaks with relevant frequencies
+            Boolean array, True where the frequency is within at least one
+            expected range. All-True when no ranges are configured.
         """
         if not self.freq_ranges:
+            return np.ones(len(frequencies), dtype=bool)
+        mask = np.zeros(len(frequencies), dtype=bool)
+        for fmin, fmax in self.freq_ranges:
+            mask |= (frequencies >= fmin) & (frequencies <= fmax)
+        return mask
+
+    def filter_peaks(self, peaks: Union[PeakArray, List[Peak]]) -> Union[PeakArray, List[Peak]]:
+        """Filter peaks to only include relevant frequencies.
+
+        Args:
+            peaks: PeakArray from DSP (or a list of Peak objects)
+
+        Returns:
+            Filtered peaks of the same kind as the input
+        """
+        if not self.freq_ranges or len(peaks) == 0:
             # No filtering configured - pass through all peaks
             return peaks
 
+        if isinstance(peaks, PeakArray):
+            # One boolean mask over the frequency array per range; no
+            # per-peak Python calls on the hot path
+            mask = self.make_mask(peaks.frequencies)
+            if mask.all():
+                return peaks
+            return PeakArray(
+                frequencies=peaks.frequencies[mask],
+                magnitudes=peaks.magnitudes[mask],
+                bin_indices=peaks.bin_indices[mask],
+            )
+
         return [p for p in peaks if self.is_relevant(p.frequency)]
 
     def __repr__(self) -> str:
@@ -6,7 +6,9 @@ lists of profiles, and bundled profiles. It handles the parsing of segments,
 frequency ranges, and resolution settings.
 """
 
+import functools
 import logging
+import os
 from pathlib import Path
 from typing import List, Union
 
@@ -14,9 +16,34 @@ import yaml
 
 from .models import AlarmProfile, Range, ResolutionConfig, Segment
 
+try:
+    # The C-based loader parses several times faster than the pure-Python
+    # SafeLoader; both enforce the same safe tag set
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not always compiled in
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _load_yaml_cached(path: str, mtime_ns: int) -> object:
+    """Parse a YAML file, memoized by (path, mtime).
+
+    Test harnesses and multi-engine setups load the same profile files
+    repeatedly; the mtime key keeps edits visible while turning repeat
+    loads into dict lookups. Callers treat the returned data as read-only.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _read_yaml(path: Union[str, Path]) -> object:
+    """Load YAML through the (path, mtime) cache."""
+    path = str(path)
+    return _load_yaml_cached(path, os.stat(path).st_mtime_ns)
+
+
 def load_profile_from_yaml(path: Union[str, Path]) -> AlarmProfile:
     """Load a single AlarmProfile from a YAML file.
 
@@ -50,8 +77,7 @@ def load_profile_from_yaml(path: Union[str, Path]) -> AlarmProfile:
         FileNotFoundError: If the file does not exist.
         ValueError: If the YAML structure is invalid.
     """
-    with open(path, "r") as f:
-        data = yaml.safe_load(f)
+    data = _read_yaml(path)
 
     return _parse_profile(data)
 
@@ -71,8 +97,7 @@ def load_profiles_from_yaml(path: Union[str, Path]) -> List[AlarmProfile]:
     Returns:
         A list of loaded AlarmProfile objects.
     """
-    with open(path, "r") as f:
-        data = yaml.safe_load(f)
+    data = _read_yaml(path)
 
     # Format 3: Bundled profiles
     if isinstance(data, dict) and "profiles" in data:
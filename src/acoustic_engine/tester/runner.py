@@ -16,6 +16,7 @@ from ..models import AlarmProfile
 from ..processing.dsp import SpectralMonitor
 from ..processing.filter import FrequencyFilter
 from ..profiles import load_profiles_from_yaml
+from .audio_cache import load_wav_cached
 from .display import Display
 from .mixer import AudioMixer
 
@@ -133,6 +134,18 @@ class TestRunner:
 
         return profiles
 
+    def reset(self):
+        """Clear per-run state so the runner can be reused across audio files.
+
+        Keeps the loaded profiles and engine components (and their warmed
+        caches) while discarding the learned noise floor, tone tracking,
+        window buffers, and results.
+        """
+        self.dsp.reset()
+        self.generator.reset()
+        self.matcher.reset()
+        self.results = TestResults(profiles_tested=len(self.profiles))
+
     def run_file(self, audio_path: Path):
         """Run detection test on an audio file.
 
@@ -148,6 +161,11 @@ class TestRunner:
         suffix = audio_path.suffix.lower()
 
         if suffix == ".wav":
+            # Fast path: a mono 16-bit WAV at the runner's rate with no noise
+            # mixing can be streamed chunk-by-chunk, keeping peak memory at
+            # O(chunk) instead of O(file)
+            if self.noise_level <= 0 and self._stream_wav(audio_path):
+                return
             audio, file_sample_rate = self._load_wav(audio_path)
         else:
             audio, file_sample_rate = self._load_with_pydub(audio_path)
@@ -160,6 +178,47 @@ class TestRunner:
             indices = np.round(np.linspace(0, len(audio) - 1, new_length)).astype(int)
             audio = audio[indices]
 
+        self._run_audio(audio)
+
+    def run_array(
+        self,
+        audio: np.ndarray,
+        sample_rate: Optional[int] = None,
+        peak: Optional[float] = None,
+    ):
+        """Run detection test on in-memory audio samples.
+
+        Skips the WAV write/read round-trip entirely. Accepts int16 PCM, or
+        float audio which is peak-normalized to 90% and quantized to int16
+        (matching what create-WAV-then-run-file would have produced).
+
+        Args:
+            audio: Audio samples (int16 PCM or float)
+            sample_rate: Sample rate of the array; defaults to the runner's
+            peak: Known peak amplitude (or an upper bound) of float audio.
+                Skips the full-array peak scan when the caller already knows
+                the signal's range.
+        """
+        self.display.separator()
+
+        # Resample if needed (simple nearest-neighbor)
+        if sample_rate is not None and sample_rate != self.sample_rate:
+            self.display.warning(f"Resampling from {sample_rate}Hz to {self.sample_rate}Hz")
+            ratio = self.sample_rate / sample_rate
+            new_length = int(len(audio) * ratio)
+            indices = np.round(np.linspace(0, len(audio) - 1, new_length)).astype(int)
+            audio = audio[indices]
+
+        if audio.dtype != np.int16:
+            if peak is None:
+                peak = max(audio.max(), -audio.min())
+            scale = (0.9 * 32767 / peak) if peak > 0 else 0.0
+            audio = (audio * scale).astype(np.int16)
+
+        self._run_audio(audio)
+
+    def _run_audio(self, audio: np.ndarray):
+        """Mix noise into int16 audio and run it through the pipeline."""
         # Convert to float for noise mixing
         audio_float = audio.astype(np.float32) / 32768.0
 
@@ -186,29 +245,42 @@ class TestRunner:
 
         self.display.success("Processing complete")
 
-    def _load_wav(self, audio_path: Path) -> Tuple[np.ndarray, int]:
-        """Load a WAV file using the built-in wave module."""
+    def _stream_wav(self, audio_path: Path) -> bool:
+        """Stream a WAV file through the pipeline without a full decode.
+
+        Only handles the common case (mono, 16-bit, matching sample rate);
+        returns False so the caller can fall back to the full load otherwise.
+        Chunk boundaries and results match _run_audio exactly.
+        """
         with wave.open(str(audio_path), "rb") as wf:
-            n_channels = wf.getnchannels()
-            sample_width = wf.getsampwidth()
-            file_sample_rate = wf.getframerate()
+            if (
+                wf.getnchannels() != 1
+                or wf.getsampwidth() != 2
+                or wf.getframerate() != self.sample_rate
+            ):
+                return False
+
             n_frames = wf.getnframes()
-            audio_data = wf.readframes(n_frames)
-
-        # Convert to numpy array
-        if sample_width == 2:
-            audio = np.frombuffer(audio_data, dtype=np.int16)
-        elif sample_width == 4:
-            audio = np.frombuffer(audio_data, dtype=np.int32)
-            audio = (audio / 2147483648.0 * 32768).astype(np.int16)
-        else:
-            raise ValueError(f"Unsupported sample width: {sample_width}")
+            self.results.duration = n_frames / self.sample_rate
+            self.display.info(f"Processing {self.results.duration:.1f}s of audio (streaming)...")
 
-        # Convert stereo to mono if needed
-        if n_channels == 2:
-            audio = audio.reshape(-1, 2).mean(axis=1).astype(np.int16)
+            # Same bound as the in-memory loop: the final chunk (full or
+            # partial) is not processed
+            n_chunks = len(range(0, n_frames - self.chunk_size, self.chunk_size))
+            for i in range(n_chunks):
+                chunk = np.frombuffer(wf.readframes(self.chunk_size), dtype=np.int16)
+                self._process_chunk(chunk, i * self.chunk_size / self.sample_rate)
+
+        self.display.success("Processing complete")
+        return True
 
-        return audio, file_sample_rate
+    def _load_wav(self, audio_path: Path) -> Tuple[np.ndarray, int]:
+        """Load a WAV file, reusing the decoded array across runners.
+
+        Multi-profile verification opens the same file once per profile;
+        the cache keyed by (path, mtime) makes repeat loads free.
+        """
+        return load_wav_cached(str(audio_path), audio_path.stat().st_mtime_ns)
 
     def _load_with_pydub(self, audio_path: Path) -> Tuple[np.ndarray, int]:
         """Load audio file using ffmpeg (supports MP3, OGG, FLAC, etc.).